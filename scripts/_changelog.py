@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Shared CHANGELOG.md section lookup for the release scripts.
+
+release_notes.py, nightly_release_notes.py, and update_changelog.py
+each scanned every line looking for `## [` headers, twice per lookup.
+index_sections builds the whole version -> span map in a single pass
+so every later lookup is a dict hit.
+"""
+from __future__ import annotations
+
+HEADER_PREFIX = "## ["
+
+
+def header_version(line: str) -> str:
+    """Extract the version token from a `## [X.Y.Z] - date` header line."""
+    close = line.find("]", len(HEADER_PREFIX))
+    if close < 0:
+        close = len(line)
+    return line[len(HEADER_PREFIX):close]
+
+
+def index_sections(lines: list[str]) -> dict[str, tuple[int, int]]:
+    """Map each version to its (start, end) line span in one pass.
+
+    The first occurrence of a version wins, matching the old
+    first-match linear scans.
+    """
+    index: dict[str, tuple[int, int]] = {}
+    open_version: str | None = None
+    open_start = 0
+    for idx, line in enumerate(lines):
+        if not line.startswith(HEADER_PREFIX):
+            continue
+        if open_version is not None:
+            index.setdefault(open_version, (open_start, idx))
+        open_version = header_version(line)
+        open_start = idx
+    if open_version is not None:
+        index.setdefault(open_version, (open_start, len(lines)))
+    return index
+
+
+def extract_entry(lines: list[str], version: str) -> str | None:
+    span = index_sections(lines).get(version)
+    if span is None:
+        return None
+    start, end = span
+    return "\n".join(lines[start:end]).rstrip()
+
+
+def extract_entry_text(raw: str, version: str) -> str | None:
+    """Extract one version's section from the raw changelog text.
+
+    Uses str.find offsets so the file is never split into per-line
+    strings and rejoined.
+    """
+    header = f"{HEADER_PREFIX}{version}]"
+    if raw.startswith(header):
+        start = 0
+    else:
+        at = raw.find(f"\n{header}")
+        if at < 0:
+            return None
+        start = at + 1
+    end = raw.find(f"\n{HEADER_PREFIX}", start + 1)
+    if end < 0:
+        end = len(raw)
+    return raw[start:end].rstrip()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Shared git access for the release-automation scripts.
+
+Running next_version.py and update_changelog.py back-to-back used to
+spawn git once per query, plus once per commit for changed-file lists.
+These helpers keep each query to a single streamed invocation and give
+both scripts one place for the delimiter conventions.
+"""
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+# ASCII record/unit separators; git never emits either in subjects or
+# bodies, so records cannot collide the way sentinel strings can.
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+
+
+def run_git(args: list[str], cwd: Path) -> str:
+    try:
+        return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
+    except subprocess.CalledProcessError as exc:
+        msg = exc.output if exc.output else str(exc)
+        raise RuntimeError(msg) from exc
+
+
+def stream_git(args: list[str], cwd: Path, separator: str = "\x00") -> Iterator[str]:
+    """Yield delimiter-separated records from git without buffering the full output."""
+    proc = subprocess.Popen(["git", *args], cwd=cwd, stdout=subprocess.PIPE, text=True)
+    assert proc.stdout is not None
+    exhausted = False
+    try:
+        buffer = ""
+        while True:
+            chunk = proc.stdout.read(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            *records, buffer = buffer.split(separator)
+            yield from records
+        if buffer:
+            yield buffer
+        exhausted = True
+    finally:
+        # A consumer that stops early (e.g. classify_bump returning on
+        # the first breaking commit) abandons the generator; kill git
+        # promptly instead of letting it write out the rest of the log.
+        proc.stdout.close()
+        if not exhausted and proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+    if proc.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} exited with {proc.returncode}")
+
+
+def list_tags(repo: Path) -> list[str]:
+    """Return v-prefixed tag names, version-sorted newest-first by git."""
+    raw = run_git(
+        ["for-each-ref", "--sort=-v:refname", "--format=%(refname:short)", "refs/tags/v*"],
+        cwd=repo,
+    )
+    return raw.splitlines()
+
+
+def last_tag(repo: Path) -> str | None:
+    try:
+        return run_git(["describe", "--tags", "--abbrev=0"], cwd=repo)
+    except RuntimeError:
+        return None
+
+
+def log_commits(
+    repo: Path,
+    base_tag: str | None,
+    with_files: bool = False,
+) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+    """Yield (subject, body, files) per commit from one git invocation.
+
+    With with_files=True the changed-file names ride along in the same
+    log stream via --name-only, so no per-commit `git show` is needed.
+    """
+    range_spec = f"{base_tag}..HEAD" if base_tag else "HEAD"
+    if with_files:
+        args = [
+            "log",
+            range_spec,
+            "--name-only",
+            f"--pretty=format:{RECORD_SEP}%s{FIELD_SEP}%b{FIELD_SEP}",
+        ]
+        for record in stream_git(args, repo, separator=RECORD_SEP):
+            if not record.strip():
+                continue
+            subject, _, rest = record.partition(FIELD_SEP)
+            body, _, files_text = rest.partition(FIELD_SEP)
+            files = tuple(line.strip() for line in files_text.splitlines() if line.strip())
+            yield subject, body.rstrip("\n"), files
+    else:
+        args = ["log", range_spec, "-z", f"--pretty=format:%s{FIELD_SEP}%b"]
+        for record in stream_git(args, repo):
+            if not record:
+                continue
+            subject, _, body = record.partition(FIELD_SEP)
+            yield subject, body, ()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""JSON serialization for the release scripts.
+
+Uses orjson's native writer when it is installed and falls back to the
+stdlib; both produce the same two-space-indented layout.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_bytes(obj: Any) -> bytes:
+    """Indented UTF-8 JSON bytes, ready for write_bytes without a re-encode."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
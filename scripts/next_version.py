@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import argparse
 import re
-import subprocess
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+from _git import list_tags as list_tag_names, log_commits
 from sync_doc_versions import sync_doc_versions
 
 VERSION_RE = re.compile(r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:\.(\d+))?$")
@@ -14,14 +15,6 @@ FEATURE_RE = re.compile(r"^feat(\(.+\))?:", re.IGNORECASE)
 BREAKING_RE = re.compile(r"^\w+(\(.+\))?!:")
 
 
-def run_git(args: list[str], cwd: Path) -> str:
-    try:
-        return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
-    except subprocess.CalledProcessError as exc:
-        msg = exc.output if exc.output else str(exc)
-        raise RuntimeError(msg) from exc
-
-
 def parse_version(text: str) -> list[int] | None:
     match = VERSION_RE.match(text.strip())
     if not match:
@@ -45,9 +38,10 @@ def read_version_file(path: Path) -> list[int]:
 
 
 def list_tags(repo: Path) -> list[tuple[str, list[int]]]:
-    tags_raw = run_git(["tag", "--list", "v*"], cwd=repo)
+    # Tags arrive already version-sorted newest-first, so callers can
+    # take the first match instead of scanning for a max.
     tags = []
-    for tag in tags_raw.splitlines():
+    for tag in list_tag_names(repo):
         parts = parse_version(tag)
         if parts:
             tags.append((tag, parts))
@@ -55,37 +49,26 @@ def list_tags(repo: Path) -> list[tuple[str, list[int]]]:
 
 
 def latest_stable_tag(tags: list[tuple[str, list[int]]]) -> tuple[str, list[int]] | None:
-    stable = [(tag, parts) for tag, parts in tags if len(parts) == 3]
-    if not stable:
-        return None
-    return max(stable, key=lambda item: tuple(item[1]))
+    for tag, parts in tags:
+        if len(parts) == 3:
+            return tag, parts
+    return None
 
 
-def commits_since(repo: Path, base_tag: str | None) -> list[tuple[str, str]]:
-    if base_tag:
-        range_spec = f"{base_tag}..HEAD"
-    else:
-        range_spec = "HEAD"
-    log = run_git(["log", range_spec, "--pretty=format:%s%n%b%n==END=="], cwd=repo)
-    entries = [entry.strip() for entry in log.split("==END==") if entry.strip()]
-    commits = []
-    for entry in entries:
-        lines = entry.splitlines()
-        subject = lines[0] if lines else ""
-        body = "\n".join(lines[1:]) if len(lines) > 1 else ""
-        commits.append((subject.strip(), body))
-    return commits
-
-
-def classify_bump(commits: list[tuple[str, str]]) -> str | None:
-    if not commits:
-        return None
-    bump = "patch"
+def commits_since(repo: Path, base_tag: str | None) -> Iterator[tuple[str, str]]:
+    for subject, body, _ in log_commits(repo, base_tag):
+        yield subject, body
+
+
+def classify_bump(commits: Iterable[tuple[str, str]]) -> str | None:
+    bump = None
     for subject, body in commits:
         if BREAKING_RE.match(subject) or "BREAKING CHANGE" in body:
             return "major"
         if FEATURE_RE.match(subject):
             bump = "minor"
+        elif bump is None:
+            bump = "patch"
     return bump
 
 
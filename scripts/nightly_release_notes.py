@@ -6,22 +6,14 @@ import datetime as dt
 import sys
 from pathlib import Path
 
+from _changelog import extract_entry_text
 
-def extract_changelog_entry(lines: list[str], version: str) -> str:
-    start = None
-    for idx, line in enumerate(lines):
-        if line.startswith(f"## [{version}]"):
-            start = idx
-            break
-    if start is None:
-        raise ValueError(f"Version {version} not found in changelog.")
 
-    end = len(lines)
-    for idx in range(start + 1, len(lines)):
-        if lines[idx].startswith("## ["):
-            end = idx
-            break
-    return "\n".join(lines[start:end]).rstrip()
+def extract_changelog_entry(raw: str, version: str) -> str:
+    entry = extract_entry_text(raw, version)
+    if entry is None:
+        raise ValueError(f"Version {version} not found in changelog.")
+    return entry
 
 
 def strip_entry_heading(entry: str) -> str:
@@ -48,19 +40,20 @@ def main() -> int:
     args = parser.parse_args()
 
     version = args.version.lstrip("vV")
-    changelog_path = Path(args.changelog).resolve()
+    changelog_path = Path(args.changelog)
     if not changelog_path.exists():
         print(f"Changelog file not found: {changelog_path}", file=sys.stderr)
         return 1
 
-    lines = changelog_path.read_text(encoding="utf-8").splitlines()
+    raw = changelog_path.read_text(encoding="utf-8")
     try:
-        entry = extract_changelog_entry(lines, version)
+        entry = extract_changelog_entry(raw, version)
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 1
 
-    utc_now = dt.datetime.now(dt.UTC).strftime("%Y-%m-%d %H:%M UTC")
+    now = dt.datetime.now(dt.UTC)
+    utc_now = f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d} UTC"
     notes = [
         f"# PakFu Nightly v{version}",
         "",
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import re
 from dataclasses import asdict, dataclass
 
+from _jsonio import dumps
+
 SUPPORTED_PLATFORMS = ("windows", "macos", "linux")
 SUPPORTED_KINDS = ("portable", "installer")
 
@@ -25,7 +27,7 @@ ASSET_RE = re.compile(
     r"(?P<arch>[a-z0-9_]+)-"
     r"(?P<kind>portable|installer)\."
     r"(?P<ext>[a-z0-9.]+)$",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 
@@ -40,15 +42,22 @@ class ReleaseAsset:
     installable: bool
 
 
+_ARCH_MAP = {
+    "x86_64": "x64",
+    "amd64": "x64",
+    "x64": "x64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_arch(raw_arch: str) -> str:
     value = raw_arch.strip().lower()
-    if value in {"x86_64", "amd64", "x64"}:
-        return "x64"
-    if value in {"aarch64", "arm64"}:
-        return "arm64"
-    return value
+    return _ARCH_MAP.get(value, value)
 
 
+@functools.lru_cache(maxsize=64)
 def expected_extension(platform: str, kind: str) -> str:
     key = (platform.lower(), kind.lower())
     ext = EXPECTED_EXTENSIONS.get(key)
@@ -72,7 +81,12 @@ def expected_filename(version: str, platform: str, arch: str, kind: str) -> str:
     return f"pakfu-{version}-{normalized_platform}-{normalized_arch}-{normalized_kind}.{ext}"
 
 
+@functools.lru_cache(maxsize=8192)
 def parse_asset_name(filename: str) -> ReleaseAsset | None:
+    # Cheap prefix/extension rejects keep non-asset files (manifests,
+    # checksums, stray build output) out of the regex engine entirely.
+    if filename[:6].lower() != "pakfu-" or "." not in filename:
+        return None
     match = ASSET_RE.match(filename)
     if not match:
         return None
@@ -122,7 +136,7 @@ def _main() -> int:
             asdict(parse_asset_name(installer)),
         ],
     }
-    print(json.dumps(payload, indent=2))
+    print(dumps(payload))
     return 0
 
 
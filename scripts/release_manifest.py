@@ -2,66 +2,82 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
 import hashlib
-import json
+import mmap
+import os
 from pathlib import Path
 
-from release_assets import SUPPORTED_PLATFORMS, parse_asset_name
+from _jsonio import dump_bytes
+from release_assets import SUPPORTED_PLATFORMS, ReleaseAsset, parse_asset_name
+
+# Below this size mapping is not worth the setup cost; file_digest's C
+# read loop wins for small files.
+MMAP_THRESHOLD = 8 * 1024 * 1024
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
-
+        if path.stat().st_size > MMAP_THRESHOLD:
+            # One zero-copy buffer for hashlib to walk entirely in C.
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        # file_digest runs the read-and-hash loop in C (Python 3.11+).
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Generate PakFu release-manifest.json.")
-    parser.add_argument("--dist", default="dist", help="Directory containing packaged artifacts.")
-    parser.add_argument("--version", required=True, help="Release version.")
-    parser.add_argument(
-        "--output",
-        default="dist/release-manifest.json",
-        help="Output manifest path.",
-    )
-    args = parser.parse_args()
 
-    dist_dir = Path(args.dist).resolve()
-    out_path = Path(args.output).resolve()
-    if not dist_dir.exists():
-        raise RuntimeError(f"Distribution directory not found: {dist_dir}")
+def scan_dist(
+    dist_dir: Path, version: str
+) -> tuple[list[tuple[os.DirEntry[str], ReleaseAsset]], list[str]]:
+    """Partition dist entries into (DirEntry, ReleaseAsset) matches and ignored names.
 
-    assets = []
+    DirEntry caches the stat from the directory scan, so is_file() and
+    later stat() calls cost no extra syscalls per entry.
+    """
+    matched = []
     ignored = []
-    for path in sorted(dist_dir.iterdir()):
-        if not path.is_file():
+    with os.scandir(dist_dir) as scan:
+        entries = sorted(scan, key=lambda entry: entry.name)
+    for entry in entries:
+        if not entry.is_file():
             continue
-        parsed = parse_asset_name(path.name)
-        if not parsed or parsed.version != args.version:
-            ignored.append(path.name)
+        parsed = parse_asset_name(entry.name)
+        if not parsed or parsed.version != version:
+            ignored.append(entry.name)
             continue
-        assets.append(
-            {
-                "name": path.name,
-                "platform": parsed.platform,
-                "arch": parsed.arch,
-                "kind": parsed.kind,
-                "extension": parsed.extension,
-                "installable": parsed.installable,
-                "size": path.stat().st_size,
-                "sha256": sha256_file(path),
-            }
-        )
+        matched.append((entry, parsed))
+    return matched, ignored
+
+
+def hash_assets(matched: list[tuple[os.DirEntry[str], ReleaseAsset]]) -> list[dict]:
+    if not matched:
+        return []
+    # hashlib releases the GIL while digesting, so independent assets
+    # hash and read concurrently; results keep the sorted order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(matched))) as pool:
+        digests = list(pool.map(lambda item: sha256_file(Path(item[0].path)), matched))
+    return [
+        {
+            "name": entry.name,
+            "platform": parsed.platform,
+            "arch": parsed.arch,
+            "kind": parsed.kind,
+            "extension": parsed.extension,
+            "installable": parsed.installable,
+            "size": entry.stat().st_size,
+            "sha256": digest,
+        }
+        for (entry, parsed), digest in zip(matched, digests)
+    ]
+
 
-    payload = {
+def build_payload(version: str, assets: list[dict], ignored: list[str]) -> dict:
+    return {
         "product": "pakfu",
-        "version": args.version,
+        "version": version,
         "generated_at_utc": dt.datetime.now(dt.UTC).isoformat(),
         "distribution_policy": {
             platform: {
@@ -74,9 +90,32 @@ def main() -> int:
         "ignored_files": ignored,
     }
 
+
+def write_manifest(out_path: Path, payload: dict) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    out_path.write_bytes(dump_bytes(payload) + b"\n")
     print(f"Wrote manifest: {out_path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate PakFu release-manifest.json.")
+    parser.add_argument("--dist", default="dist", help="Directory containing packaged artifacts.")
+    parser.add_argument("--version", required=True, help="Release version.")
+    parser.add_argument(
+        "--output",
+        default="dist/release-manifest.json",
+        help="Output manifest path.",
+    )
+    args = parser.parse_args()
+
+    dist_dir = Path(args.dist).resolve()
+    out_path = Path(args.output).resolve()
+    if not dist_dir.exists():
+        raise RuntimeError(f"Distribution directory not found: {dist_dir}")
+
+    matched, ignored = scan_dist(dist_dir, args.version)
+    payload = build_payload(args.version, hash_assets(matched), ignored)
+    write_manifest(out_path, payload)
     return 0
 
 
@@ -6,6 +6,8 @@ import datetime as dt
 import sys
 from pathlib import Path
 
+from _changelog import extract_entry
+
 
 def strip_entry_heading(entry: str) -> str:
     lines = entry.splitlines()
@@ -27,23 +29,12 @@ def main() -> int:
         return 1
 
     lines = changelog.read_text(encoding="utf-8").splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.startswith(f"## [{version}]"):
-            start = idx
-            break
-    if start is None:
+    entry = extract_entry(lines, version)
+    if entry is None:
         print(f"Version {version} not found in CHANGELOG.md.", file=sys.stderr)
         return 1
-
-    end = len(lines)
-    for idx in range(start + 1, len(lines)):
-        if lines[idx].startswith("## ["):
-            end = idx
-            break
-
-    entry = "\n".join(lines[start:end]).rstrip()
-    generated = dt.datetime.now(dt.UTC).strftime("%Y-%m-%d %H:%M UTC")
+    now = dt.datetime.now(dt.UTC)
+    generated = f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d} UTC"
     notes = "\n".join(
         [
             f"# PakFu v{version}",
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Validate release assets and emit the manifest in a single pass.
+
+Release jobs used to run validate_release_assets.py and then
+release_manifest.py, each scanning dist/ and parsing every filename
+on its own, with a second interpreter start in between. This
+entrypoint scans the directory once and feeds both steps; the
+standalone scripts remain for jobs that only need one of them.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from release_assets import SUPPORTED_PLATFORMS
+from release_manifest import build_payload, hash_assets, scan_dist, write_manifest
+from validate_release_assets import AssetTable, unexpected_from_names, validate_assets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate PakFu release assets and generate release-manifest.json.",
+    )
+    parser.add_argument("--dist", default="dist", help="Distribution directory to inspect.")
+    parser.add_argument("--version", required=True, help="Release version.")
+    parser.add_argument(
+        "--platform",
+        choices=SUPPORTED_PLATFORMS,
+        help="Optional platform scope for validation.",
+    )
+    parser.add_argument(
+        "--arch",
+        help="Optional architecture scope (x64, arm64, etc).",
+    )
+    parser.add_argument(
+        "--output",
+        default="dist/release-manifest.json",
+        help="Output manifest path.",
+    )
+    args = parser.parse_args()
+
+    dist_dir = Path(args.dist).resolve()
+    if not dist_dir.exists():
+        print(f"Distribution directory not found: {dist_dir}", file=sys.stderr)
+        return 1
+
+    matched, ignored = scan_dist(dist_dir, args.version)
+
+    unexpected = unexpected_from_names(ignored, args.version)
+    if unexpected:
+        print("Unexpected file(s) in release dist directory:", file=sys.stderr)
+        for name in unexpected:
+            print(f"- {name}", file=sys.stderr)
+        print(
+            "Only canonical package assets and the release manifest may be published.",
+            file=sys.stderr,
+        )
+        return 1
+
+    table = AssetTable.from_assets(parsed for _, parsed in matched)
+    ok, errors = validate_assets(
+        assets=table,
+        version=args.version,
+        platform=args.platform,
+        arch=args.arch,
+    )
+    if not ok:
+        for message in errors:
+            print(message, file=sys.stderr)
+        return 1
+
+    print(f"Release assets validated for version {args.version}.")
+    payload = build_payload(args.version, hash_assets(matched), ignored)
+    write_manifest(Path(args.output).resolve(), payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import re
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from _changelog import header_version
+from _git import last_tag, log_commits
+
 SECTION_ORDER = [
     "Breaking Changes",
     "Highlights",
@@ -17,7 +20,14 @@ SECTION_ORDER = [
     "Compatibility",
 ]
 
-SUBJECT_RE = re.compile(r"^(?P<type>[a-zA-Z]+)(\(.+\))?(?P<bang>!)?:\s*(?P<desc>.+)")
+# Conventional-commit types the classifier reacts to; anything else falls
+# through to the untyped path in normalize_subject.
+KNOWN_TYPES = ("feat", "fix", "perf", "refactor", "docs", "build", "ci", "test", "style", "chore")
+
+SUBJECT_RE = re.compile(
+    rf"^(?P<type>{'|'.join(KNOWN_TYPES)})(?:\([^)]+\))?(?P<bang>!)?:\s*(?P<desc>.+)",
+    re.IGNORECASE | re.ASCII,
+)
 
 TECHNICAL_ONLY_TYPES = {"build", "ci", "chore", "docs", "style", "test"}
 TECHNICAL_ONLY_PATTERNS = (
@@ -184,39 +194,16 @@ def contains_any(text: str, needles: tuple[str, ...]) -> bool:
     return any(needle in text for needle in needles)
 
 
-def run_git(args: list[str], cwd: Path) -> str:
-    return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
-
-
-def last_tag(repo: Path) -> str | None:
-    try:
-        return run_git(["describe", "--tags", "--abbrev=0"], repo)
-    except subprocess.CalledProcessError:
-        return None
-
-
 def commit_log(repo: Path, base_tag: str | None) -> list[CommitChange]:
-    if base_tag:
-        range_spec = f"{base_tag}..HEAD"
-    else:
-        range_spec = "HEAD"
-    log = run_git(["log", range_spec, "--pretty=format:%H%n%s%n%b%n==END=="], repo)
-    entries = [entry.strip() for entry in log.split("==END==") if entry.strip()]
-    commits = []
-    for entry in entries:
-        lines = entry.splitlines()
-        commit_hash = lines[0].strip() if lines else ""
-        subject = lines[1].strip() if len(lines) > 1 else ""
-        body = "\n".join(lines[2:]) if len(lines) > 2 else ""
-        files = tuple(
-            line.strip()
-            for line in run_git(["show", "--format=", "--name-only", commit_hash], repo).splitlines()
-            if line.strip()
-        )
-        commits.append(CommitChange(subject=subject, body=body, files=files))
-    return commits
+    # --name-only rides along in the same log stream, so the changed-file
+    # list no longer costs one `git show` exec per commit.
+    return [
+        CommitChange(subject=subject, body=body, files=files)
+        for subject, body, files in log_commits(repo, base_tag, with_files=True)
+    ]
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_subject(subject: str) -> tuple[str | None, str, bool]:
     if subject.startswith("Merge "):
         return None, "", False
@@ -245,7 +232,7 @@ def should_skip_change(change_type: str | None, desc: str) -> bool:
 
 
 def add_once(sections: dict[str, list[str]], title: str, item: str) -> None:
-    items = sections.setdefault(title, [])
+    items = sections[title]
     if item not in items:
         items.append(item)
 
@@ -400,7 +387,9 @@ def classify_user_change(
 
 
 def build_sections(commits: list[CommitChange | tuple[str, str] | tuple[str, str, tuple[str, ...]]]) -> dict[str, list[str]]:
-    sections: dict[str, list[str]] = {}
+    # Pre-bind every section so the per-commit path is a plain dict hit
+    # instead of setdefault churn; empties are dropped on the way out.
+    sections: dict[str, list[str]] = {title: [] for title in SECTION_ORDER}
     for raw_commit in commits:
         commit = normalize_change(raw_commit)
         subject = commit.subject
@@ -415,35 +404,41 @@ def build_sections(commits: list[CommitChange | tuple[str, str] | tuple[str, str
             continue
         for title, item in classify_user_change(change_type, desc, body, commit.files):
             add_once(sections, title, item)
-    return sections
-
-
-def load_changelog(path: Path) -> list[str]:
-    if not path.exists():
-        return [
-            "# Changelog",
-            "",
-            "All notable changes to PakFu are documented here.",
-            "",
-        ]
-    return path.read_text(encoding="utf-8").splitlines()
+    return {title: items for title, items in sections.items() if items}
 
 
-def write_changelog(path: Path, lines: list[str]) -> None:
-    text = "\n".join(lines).rstrip() + "\n"
-    path.write_text(text, encoding="utf-8")
+DEFAULT_PRELUDE = b"# Changelog\n\nAll notable changes to PakFu are documented here.\n\n"
 
 
-def insert_entry(lines: list[str], entry: list[str]) -> list[str]:
-    for line in lines:
-        if line.startswith(entry[0]):
-            return lines
-    insert_at = len(lines)
-    for idx, line in enumerate(lines):
-        if line.startswith("## ["):
-            insert_at = idx
-            break
-    return lines[:insert_at] + entry + [""] + lines[insert_at:]
+def load_changelog(path: Path) -> bytes:
+    if not path.exists():
+        return DEFAULT_PRELUDE
+    return path.read_bytes()
+
+
+def insert_entry(data: bytes, entry: list[str]) -> bytes:
+    """Splice the entry before the first version header.
+
+    Works on the raw bytes so a large changelog is never decoded into
+    per-line str objects and rejoined; the unchanged tail is carried
+    over as a single slice. Returns data unchanged if the version is
+    already present.
+    """
+    version_key = f"## [{header_version(entry[0])}]".encode("utf-8")
+    if data.startswith(version_key) or b"\n" + version_key in data:
+        return data
+    if data.startswith(b"## ["):
+        insert_at = 0
+    else:
+        header_at = data.find(b"\n## [")
+        insert_at = header_at + 1 if header_at >= 0 else len(data)
+    if insert_at == len(data):
+        entry_text = "\n".join(entry) + "\n"
+        if data and not data.endswith(b"\n"):
+            entry_text = "\n" + entry_text
+    else:
+        entry_text = "\n".join(entry) + "\n\n"
+    return data[:insert_at] + entry_text.encode("utf-8") + data[insert_at:]
 
 
 def main() -> int:
@@ -462,7 +457,8 @@ def main() -> int:
     version_file = repo / "VERSION"
     version = args.version or version_file.read_text(encoding="utf-8").strip()
     version = version.lstrip("vV")
-    date = args.date or dt.datetime.now(dt.UTC).date().isoformat()
+    today = dt.datetime.now(dt.UTC).date()
+    date = args.date or f"{today.year:04d}-{today.month:02d}-{today.day:02d}"
 
     base_tag = last_tag(repo)
     commits = commit_log(repo, base_tag)
@@ -481,9 +477,10 @@ def main() -> int:
                 entry.append(f"- {item}")
 
     changelog_path = repo / "CHANGELOG.md"
-    lines = load_changelog(changelog_path)
-    updated = insert_entry(lines, entry)
-    write_changelog(changelog_path, updated)
+    data = load_changelog(changelog_path)
+    updated = insert_entry(data, entry)
+    if updated is not data:
+        changelog_path.write_bytes(updated)
     return 0
 
 
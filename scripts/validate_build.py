@@ -2,21 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import os
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(command: list[str]) -> tuple[int, str, str]:
+def run_command(command: list[str]) -> tuple[int, str]:
+    # stderr folds into stdout so there is one pipe buffer and no
+    # post-run merge; every caller wants the combined stream anyway.
     process = subprocess.run(
         command,
         text=True,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         env=os.environ.copy(),
         check=False,
     )
-    return process.returncode, process.stdout, process.stderr
+    return process.returncode, process.stdout
 
 
 def main() -> int:
@@ -38,48 +42,40 @@ def main() -> int:
     if os.name != "nt":
         binary.chmod(binary.stat().st_mode | 0o111)
 
-    code, out, err = run_command([str(binary), "--cli", "--version"])
-    if code != 0:
-        print("CLI version check failed.", file=sys.stderr)
-        print(out, file=sys.stderr)
-        print(err, file=sys.stderr)
-        return 1
-    merged = f"{out}\n{err}"
-    if args.expected_version not in merged:
+    # The report checks are independent read-only invocations, so launch
+    # them together and let the binaries' startup costs overlap.
+    checks = [
+        ("--version", "CLI version check failed."),
+        ("--help", "CLI help check failed."),
+        ("--platform-report", "CLI platform report check failed."),
+        ("--plugin-report", "CLI plugin report check failed."),
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [
+            pool.submit(run_command, [str(binary), "--cli", flag]) for flag, _ in checks
+        ]
+        results = [future.result() for future in futures]
+
+    for (_, message), (code, output) in zip(checks, results):
+        if code != 0:
+            print(message, file=sys.stderr)
+            print(output, file=sys.stderr)
+            return 1
+
+    version_output = results[0][1]
+    if args.expected_version not in version_output:
         print(
             f"Expected version {args.expected_version} was not found in CLI output.",
             file=sys.stderr,
         )
-        print(merged, file=sys.stderr)
-        return 1
-
-    code, out, err = run_command([str(binary), "--cli", "--help"])
-    if code != 0:
-        print("CLI help check failed.", file=sys.stderr)
-        print(out, file=sys.stderr)
-        print(err, file=sys.stderr)
-        return 1
-
-    code, out, err = run_command([str(binary), "--cli", "--platform-report"])
-    if code != 0:
-        print("CLI platform report check failed.", file=sys.stderr)
-        print(out, file=sys.stderr)
-        print(err, file=sys.stderr)
-        return 1
-
-    code, out, err = run_command([str(binary), "--cli", "--plugin-report"])
-    if code != 0:
-        print("CLI plugin report check failed.", file=sys.stderr)
-        print(out, file=sys.stderr)
-        print(err, file=sys.stderr)
+        print(version_output, file=sys.stderr)
         return 1
 
     if args.run_practical_qa:
-        code, out, err = run_command([str(binary), "--cli", "--qa-practical"])
+        code, output = run_command([str(binary), "--cli", "--qa-practical"])
         if code != 0:
             print("Practical QA smoke check failed.", file=sys.stderr)
-            print(out, file=sys.stderr)
-            print(err, file=sys.stderr)
+            print(output, file=sys.stderr)
             return 1
 
     print(f"Build validation passed for {binary.name} ({args.expected_version}).")
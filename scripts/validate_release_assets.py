@@ -2,53 +2,91 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
 from release_assets import SUPPORTED_PLATFORMS, normalize_arch, parse_asset_name
 
 
-def collect_assets(dist_dir: Path):
-    assets = []
-    for path in sorted(dist_dir.iterdir()):
-        if not path.is_file():
-            continue
-        parsed = parse_asset_name(path.name)
-        if parsed:
-            assets.append(parsed)
-    return assets
+@dataclass(frozen=True)
+class AssetTable:
+    """Parsed dist assets stored as parallel columns for one-pass filtering."""
 
+    versions: tuple[str, ...]
+    platforms: tuple[str, ...]
+    archs: tuple[str, ...]
+    kinds: tuple[str, ...]
 
-def unexpected_release_files(dist_dir: Path, version: str) -> list[str]:
+    @classmethod
+    def from_assets(cls, assets) -> AssetTable:
+        versions: list[str] = []
+        platforms: list[str] = []
+        archs: list[str] = []
+        kinds: list[str] = []
+        for asset in assets:
+            versions.append(asset.version)
+            platforms.append(asset.platform)
+            archs.append(asset.arch)
+            kinds.append(asset.kind)
+        return cls(tuple(versions), tuple(platforms), tuple(archs), tuple(kinds))
+
+
+def list_dist_files(dist_dir: Path) -> list[str]:
+    # DirEntry caches the stat from the directory scan, so is_file()
+    # costs no extra syscall per entry.
+    with os.scandir(dist_dir) as scan:
+        return sorted(entry.name for entry in scan if entry.is_file())
+
+
+def collect_assets(dist_dir: Path) -> AssetTable:
+    parsed = (parse_asset_name(name) for name in list_dist_files(dist_dir))
+    return AssetTable.from_assets(asset for asset in parsed if asset)
+
+
+def unexpected_from_names(names: list[str], version: str) -> list[str]:
     allowed_manifest = f"pakfu-{version}-release-manifest.json"
     unexpected = []
-    for path in sorted(dist_dir.iterdir()):
-        if not path.is_file():
-            continue
-        parsed = parse_asset_name(path.name)
+    for name in names:
+        parsed = parse_asset_name(name)
         if parsed and parsed.version == version:
             continue
-        if path.name == allowed_manifest:
+        if name == allowed_manifest:
             continue
-        unexpected.append(path.name)
+        unexpected.append(name)
     return unexpected
 
 
+def unexpected_release_files(dist_dir: Path, version: str) -> list[str]:
+    return unexpected_from_names(list_dist_files(dist_dir), version)
+
+
 def validate_assets(
-    assets,
+    assets: AssetTable,
     version: str,
     platform: str | None,
     arch: str | None,
 ) -> tuple[bool, list[str]]:
     normalized_arch = normalize_arch(arch) if arch else None
-    filtered = [asset for asset in assets if asset.version == version]
-    if platform:
-        filtered = [asset for asset in filtered if asset.platform == platform]
-    if normalized_arch:
-        filtered = [asset for asset in filtered if asset.arch == normalized_arch]
 
-    if not filtered:
+    # Filter and group in a single pass over the columns.
+    by_platform_arch: dict[tuple[str, str], set[str]] = defaultdict(set)
+    matched = 0
+    for asset_version, asset_platform, asset_arch, kind in zip(
+        assets.versions, assets.platforms, assets.archs, assets.kinds
+    ):
+        if asset_version != version:
+            continue
+        if platform and asset_platform != platform:
+            continue
+        if normalized_arch and asset_arch != normalized_arch:
+            continue
+        matched += 1
+        by_platform_arch[(asset_platform, asset_arch)].add(kind)
+
+    if not matched:
         scope = f"version={version}"
         if platform:
             scope += f", platform={platform}"
@@ -56,10 +94,6 @@ def validate_assets(
             scope += f", arch={normalized_arch}"
         return False, [f"No release assets found for {scope}."]
 
-    by_platform_arch: dict[tuple[str, str], set[str]] = defaultdict(set)
-    for asset in filtered:
-        by_platform_arch[(asset.platform, asset.arch)].add(asset.kind)
-
     errors: list[str] = []
     if platform:
         for (asset_platform, asset_arch), kinds in by_platform_arch.items():